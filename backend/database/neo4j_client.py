@@ -119,6 +119,26 @@ def run_write_query(
         raise
 
 
+# ---------------------------------------------------------------------------
+# Plan-cache prewarm
+# ---------------------------------------------------------------------------
+def prewarm(queries: list[str]) -> None:
+    """
+    Parse and plan each static Cypher query via EXPLAIN so the server's plan
+    cache is warm before the first real call. Also surfaces Cypher syntax
+    errors at startup instead of per-request. Failures (e.g. Neo4j not yet
+    reachable) are logged and ignored — this is purely an optimisation.
+    """
+    # Plain session.run (no managed retries) so an unreachable server fails
+    # fast instead of blocking startup behind the driver's retry policy.
+    try:
+        with get_session() as session:
+            for cypher in queries:
+                session.run("EXPLAIN " + cypher).consume()
+    except Exception as exc:  # noqa: BLE001
+        logger.debug("Query prewarm skipped: %s", exc)
+
+
 # ---------------------------------------------------------------------------
 # Health check
 # ---------------------------------------------------------------------------
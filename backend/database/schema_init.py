@@ -68,6 +68,10 @@ _INDEXES: list[tuple[str, str, str]] = [
     ("idx_invoice_risk_level",   "Invoice",   "risk_level"),
     ("idx_invoice_date",         "Invoice",   "invoice_date"),
     ("idx_invoice_number",       "Invoice",   "invoice_number"),
+    # Reconciliation batch filters match on these; without indexes the
+    # planner falls back to a full Invoice label scan
+    ("idx_invoice_supplier",     "Invoice",   "supplier_gstin"),
+    ("idx_invoice_buyer",        "Invoice",   "buyer_gstin"),
     ("idx_taxpayer_risk_score",  "Taxpayer",  "risk_score"),
     ("idx_taxpayer_state",       "Taxpayer",  "state_code"),
     ("idx_gstr1_period",         "GSTR1",     "tax_period"),
@@ -53,6 +53,11 @@ async def lifespan(app: FastAPI):
     connected = verify_connectivity()
     if connected:
         init_schema()
+        # Warm the plan cache for the reconciliation queries once the DB is
+        # known reachable (imported here so the engine module itself stays
+        # free of import-time side effects).
+        from services.reconciliation.engine import prewarm_queries
+        prewarm_queries()
     else:
         logger.warning(
             "Neo4j is not reachable at %s — schema init skipped. "
@@ -248,6 +248,18 @@ class GSTR3BIngestionRow(BaseModel):
         return data
 
 
+# Raw mode strings → PaymentMode values, built once instead of per row
+_PAYMENT_MODE_MAP: dict[str, str] = {
+    "NETBANKING": "OTHER",
+    "NEFT":       "NEFT",
+    "RTGS":       "RTGS",
+    "IMPS":       "IMPS",
+    "CHALLAN":    "CHALLAN",
+    "ITC":        "ITC",
+    "CASH":       "CASH",
+}
+
+
 class TaxPaymentIngestionRow(BaseModel):
     """One row from tax_payments.xlsx (generator schema)."""
     payment_id:    str
@@ -274,17 +286,9 @@ class TaxPaymentIngestionRow(BaseModel):
                 d["amount_paid"] = d["amount"]
             # mode → payment_mode (normalize strings to PaymentMode enum values)
             if not d.get("payment_mode") and d.get("mode"):
-                raw = str(d["mode"]).strip().upper()
-                _mode_map = {
-                    "NETBANKING": "OTHER",
-                    "NEFT":       "NEFT",
-                    "RTGS":       "RTGS",
-                    "IMPS":       "IMPS",
-                    "CHALLAN":    "CHALLAN",
-                    "ITC":        "ITC",
-                    "CASH":       "CASH",
-                }
-                d["payment_mode"] = _mode_map.get(raw, "OTHER")
+                mode = d["mode"]
+                raw = (mode if isinstance(mode, str) else str(mode)).strip().upper()
+                d["payment_mode"] = _PAYMENT_MODE_MAP.get(raw, "OTHER")
             # amount_paid fallback
             if not d.get("amount_paid"):
                 d["amount_paid"] = d.get("amount", 0.0)
@@ -90,6 +90,19 @@ Remember: You're helping users make correct tax decisions. Be thorough and accur
 గుర్తుంచుకోండి: వినియోగదారులకు స올ідమైన పన్ను నిర్ణయాలు తీసుకోవడంలో సహాయం చేస్తున్నారు. సంపూర్ణ మరియు ఖచ్చితమైనగా ఉండండి."""
 }
 
+# Closing language instruction appended to each system prompt.  Folded in
+# once at import so answer() does a single dict lookup per call instead of
+# rebuilding the instruction table and re-concatenating the prompt.
+_LANGUAGE_INSTRUCTION = {
+    "en": "\n\nRespond in English.",
+    "hi": "\n\nअपना उत्तर हिंदी में दें।",
+    "te": "\n\nతెలుగులో సమాధానం ఇవ్వండి।",
+}
+_SYSTEM_PROMPTS_WITH_LANG = {
+    lang: prompt + _LANGUAGE_INSTRUCTION.get(lang, "")
+    for lang, prompt in GST_SYSTEM_PROMPTS.items()
+}
+
 
 class GSTAssistant:
     """GST reconciliation assistant powered by Gemini."""
@@ -127,19 +140,12 @@ class GSTAssistant:
         Raises:
             Exception: If API call fails
         """
-        # Get system prompt for language, default to English if not found
-        system = GST_SYSTEM_PROMPTS.get(language, GST_SYSTEM_PROMPTS["en"])
-        
-        # Add language instruction at the end
-        language_instruction = {
-            "en": "\n\nRespond in English.",
-            "hi": "\n\nअपना उत्तर हिंदी में दें।",
-            "te": "\n\nతెలుగులో సమాధానం ఇవ్వండి।"
-        }
-        system += language_instruction.get(language, "")
-        
+        # Prompt + language instruction are pre-joined at import; unknown
+        # languages fall back to the plain English prompt as before.
+        system = _SYSTEM_PROMPTS_WITH_LANG.get(language, GST_SYSTEM_PROMPTS["en"])
+
         if context:
-            system += f"\n\nContext about current data:\n{context}"
+            system = f"{system}\n\nContext about current data:\n{context}"
 
         return self.gemini.generate_response(
             message=question,
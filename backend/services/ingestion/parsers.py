@@ -22,7 +22,7 @@ import logging
 from typing import Any, Type, TypeVar
 
 import pandas as pd
-from pydantic import BaseModel, ValidationError
+from pydantic import BaseModel, TypeAdapter, ValidationError
 
 from models.schemas import (
     GSTR1IngestionRow,
@@ -37,6 +37,7 @@ from services.validators import (
     validate_gstr1_row,
     validate_gstr2b_row,
     validate_gstr3b_row,
+    validate_invoice_frame,
     validate_invoice_row,
     validate_tax_payment_row,
     validate_taxpayer_row,
@@ -46,6 +47,10 @@ logger = logging.getLogger(__name__)
 
 T = TypeVar("T", bound=BaseModel)
 
+# Batch adapter: validates a whole list of invoice rows in one
+# pydantic-core call instead of a Python-level model_validate per row.
+_INVOICE_LIST_ADAPTER = TypeAdapter(list[InvoiceIngestionRow])
+
 # ---------------------------------------------------------------------------
 # Column name normalisation
 # ---------------------------------------------------------------------------
@@ -196,7 +201,41 @@ def parse_invoices(
 ) -> tuple[list[InvoiceIngestionRow], list[dict]]:
     """Parse invoices file → (valid InvoiceIngestionRow list, error list)."""
     rows = _read_bytes(file_bytes, filename)
-    return _parse_and_validate(rows, InvoiceIngestionRow, validate_invoice_row)
+    if not rows:
+        return [], []
+
+    # Invoices are the largest uploads, so field-level validation runs
+    # column-at-a-time over the whole frame; only rows that pass go through
+    # per-row Pydantic construction.
+    valid_df, invalid_df = validate_invoice_frame(pd.DataFrame(rows))
+
+    error_rows: list[dict[str, Any]] = [
+        {"row_index": int(idx), "row_data": rows[int(idx)], "errors": list(errs)}
+        for idx, errs in zip(invalid_df.index, invalid_df["validation_errors"])
+    ]
+
+    idxs       = [int(i) for i in valid_df.index]
+    candidates = [rows[i] for i in idxs]
+    try:
+        # One pydantic-core call for the whole batch — rows that already
+        # passed field validation almost always construct cleanly.
+        valid_models = _INVOICE_LIST_ADAPTER.validate_python(candidates)
+    except ValidationError:
+        # Rare path: fall back to per-row construction so each failure is
+        # attributed to its row with the same error payload as before.
+        valid_models = []
+        for idx, row in zip(idxs, candidates):
+            try:
+                valid_models.append(InvoiceIngestionRow.model_validate(row))
+            except ValidationError as exc:
+                error_rows.append({
+                    "row_index": idx,
+                    "row_data":  row,
+                    "errors":    [str(e) for e in exc.errors()],
+                })
+
+    error_rows.sort(key=lambda e: e["row_index"])
+    return valid_models, error_rows
 
 
 def parse_gstr1(
@@ -21,6 +21,8 @@ from __future__ import annotations
 
 import logging
 
+import numpy as np
+
 from database.neo4j_client import run_query
 
 logger = logging.getLogger(__name__)
@@ -123,36 +125,52 @@ def extract_features() -> list[dict]:
     pay_lk  = {r["gstin"]: r for r in pay_rows  if r.get("gstin")}
     file_lk = {r["gstin"]: r for r in file_rows if r.get("gstin")}
 
-    all_gstins = set(inv_lk) | set(pay_lk) | set(file_lk)
-    features: list[dict] = []
-
-    for gstin in all_gstins:
-        inv  = inv_lk.get(gstin, {})
-        pay  = pay_lk.get(gstin, {})
-        fil  = file_lk.get(gstin, {})
-
-        n_inv       = int(inv.get("invoice_count") or 0)
-        n_high      = int(inv.get("high_risk_count") or 0)
-        n_warn      = int(inv.get("warning_count") or 0)
-        n_amend     = int(inv.get("amendment_count") or 0)
-        n_mismatch  = int(inv.get("mismatch_count") or 0)
-        n_no_pay    = int(pay.get("no_payment_count") or 0)
-        avg_delay   = float(pay.get("avg_delay") or 0.0)
-        n_filings   = int(fil.get("total_filings") or 0)
-        n_late      = int(fil.get("late_count") or 0)
-
-        safe = max(n_inv, 1)  # avoid zero-division
+    all_gstins = list(set(inv_lk) | set(pay_lk) | set(file_lk))
+    if not all_gstins:
+        logger.info("Extracted features for 0 taxpayers")
+        return []
+
+    # Gather raw counts into column arrays, then compute all ratios and the
+    # rounding in one vectorized pass instead of ~6 round()/div calls per row.
+    def _col(lookup: dict, key: str) -> np.ndarray:
+        return np.array(
+            [float(lookup.get(g, {}).get(key) or 0) for g in all_gstins],
+            dtype=np.float64,
+        )
+
+    n_inv      = _col(inv_lk,  "invoice_count")
+    n_high     = _col(inv_lk,  "high_risk_count")
+    n_warn     = _col(inv_lk,  "warning_count")
+    n_amend    = _col(inv_lk,  "amendment_count")
+    n_mismatch = _col(inv_lk,  "mismatch_count")
+    n_no_pay   = _col(pay_lk,  "no_payment_count")
+    avg_delay  = _col(pay_lk,  "avg_delay")
+    n_filings  = _col(file_lk, "total_filings")
+    n_late     = _col(file_lk, "late_count")
+
+    safe       = np.maximum(n_inv, 1.0)       # avoid zero-division
+    safe_fil   = np.maximum(n_filings, 1.0)
+
+    high_ratio     = np.round(n_high     / safe, 4)
+    warn_ratio     = np.round(n_warn     / safe, 4)
+    amend_rate     = np.round(n_amend    / safe, 4)
+    no_pay_rate    = np.round(n_no_pay   / safe, 4)
+    delay_days     = np.round(np.maximum(avg_delay, 0.0), 2)
+    late_rate      = np.round(n_late     / safe_fil, 4)
+    mismatch_rate  = np.round(n_mismatch / safe, 4)
 
+    features: list[dict] = []
+    for i, gstin in enumerate(all_gstins):
         features.append({
             "gstin":               gstin,
-            "invoice_count":       n_inv,
-            "high_risk_ratio":     round(n_high    / safe, 4),
-            "warning_ratio":       round(n_warn    / safe, 4),
-            "amendment_rate":      round(n_amend   / safe, 4),
-            "missing_payment_rate":round(n_no_pay  / safe, 4),
-            "avg_delay_days":      round(max(avg_delay, 0.0), 2),
-            "late_filing_rate":    round(n_late / max(n_filings, 1), 4),
-            "value_mismatch_rate": round(n_mismatch / safe, 4),
+            "invoice_count":       int(n_inv[i]),
+            "high_risk_ratio":     float(high_ratio[i]),
+            "warning_ratio":       float(warn_ratio[i]),
+            "amendment_rate":      float(amend_rate[i]),
+            "missing_payment_rate":float(no_pay_rate[i]),
+            "avg_delay_days":      float(delay_days[i]),
+            "late_filing_rate":    float(late_rate[i]),
+            "value_mismatch_rate": float(mismatch_rate[i]),
         })
 
     logger.info("Extracted features for %d taxpayers", len(features))
@@ -26,6 +26,7 @@ Risk level thresholds:
 from __future__ import annotations
 
 import logging
+import threading
 from pathlib import Path
 
 import joblib
@@ -45,6 +46,12 @@ MODEL_DIR    = _BACKEND_DIR / "data" / "models"
 IF_PATH      = MODEL_DIR / "isolation_forest.pkl"
 SCALER_PATH  = MODEL_DIR / "scaler.pkl"
 
+# Reusable (1, n_features) buffer for single-vendor scoring so the hot
+# endpoint path doesn't allocate a fresh array per call. FastAPI runs sync
+# endpoints in a thread pool, so access is serialized with a lock.
+_ONE_ROW      = np.empty((1, len(FEATURE_NAMES)), dtype=np.float64)
+_ONE_ROW_LOCK = threading.Lock()
+
 
 # ---------------------------------------------------------------------------
 # Helpers
@@ -176,11 +183,11 @@ def score_vendor(gstin: str) -> dict:
 
     if iso is not None and scaler is not None:
         try:
-            X_arr = np.array(
-                [[float(row[f]) for f in FEATURE_NAMES]], dtype=float
-            )
-            X_sc       = scaler.transform(X_arr)
-            raw_if     = iso.score_samples(X_sc)[0]
+            with _ONE_ROW_LOCK:
+                for j, f in enumerate(FEATURE_NAMES):
+                    _ONE_ROW[0, j] = float(row[f])
+                X_sc   = scaler.transform(_ONE_ROW)
+                raw_if = iso.score_samples(X_sc)[0]
             final_score = _apply_if_adjustment(base_score, float(raw_if))
         except Exception as exc:
             logger.warning("IF single-vendor scoring failed: %s", exc)
@@ -27,14 +27,15 @@ from models.schemas import AmendmentChainResult, RiskLevel
 
 logger = logging.getLogger(__name__)
 
-# Count distinct amendment roots per supplier (depth-1 chains)
+# Count distinct amendment roots per supplier (depth-1 chains).
+# max_depth is always 1 here, so it is filled in Python-side rather than
+# computed as a constant aggregate per row.
 _AMEND_COUNT_QUERY = """
 MATCH (new_inv:Invoice)-[:AMENDS]->(orig:Invoice)
 MATCH (new_inv)-[:ISSUED_BY]->(t:Taxpayer)
 RETURN
     t.gstin                  AS gstin,
-    count(DISTINCT orig)     AS chain_count,
-    max(1)                   AS max_depth
+    count(DISTINCT orig)     AS chain_count
 ORDER BY chain_count DESC
 """
 
@@ -61,6 +62,7 @@ def detect_amendment_chains() -> list[AmendmentChainResult]:
     flag_count = config.AMENDMENT_FLAG_COUNT
 
     # Try deep traversal first
+    shallow = False
     try:
         rows = run_query(_AMEND_DEPTH_QUERY)
     except Exception as exc:
@@ -68,6 +70,7 @@ def detect_amendment_chains() -> list[AmendmentChainResult]:
         rows = []
 
     if not rows:
+        shallow = True
         try:
             rows = run_query(_AMEND_COUNT_QUERY)
         except Exception as exc:
@@ -80,7 +83,7 @@ def detect_amendment_chains() -> list[AmendmentChainResult]:
     for row in rows:
         gstin       = row.get("gstin")
         chain_count = int(row.get("chain_count") or 0)
-        max_depth   = int(row.get("max_depth") or 1)
+        max_depth   = 1 if shallow else int(row.get("max_depth") or 1)
 
         if not gstin or gstin in seen:
             continue
@@ -32,7 +32,12 @@ logger = logging.getLogger(__name__)
 # We match via invoice edges so that the same GSTIN pair covered by multiple
 # invoices still counts as a single logical hop.
 # The WHERE clause enforces all three nodes are distinct and prevents counting
-# the same loop in different rotations by requiring a < b and a < c.
+# the same loop in different rotations by requiring a < b and a < c.  The two
+# opposite traversal directions (A→B→C→A and A→C→B→A) both survive that
+# filter, so the group key sorts the (b, c) pair — both directions collapse
+# into one canonical cycle per party triple, matching _cycle_id.
+# Rows are grouped per canonical cycle before LIMIT, so we never ship
+# duplicate rotations across the wire and the cap applies to unique cycles.
 # ---------------------------------------------------------------------------
 _CIRCULAR_3_QUERY = """
 MATCH
@@ -44,15 +49,20 @@ MATCH
     (i3)-[:RECEIVED_BY]->(a)
 WHERE a <> b AND b <> c AND a <> c
   AND a.gstin < b.gstin AND a.gstin < c.gstin
-RETURN
-    a.gstin        AS g_a,
-    b.gstin        AS g_b,
-    c.gstin        AS g_c,
-    i1.invoice_id  AS inv_ab,
-    i2.invoice_id  AS inv_bc,
-    i3.invoice_id  AS inv_ca,
-    i1._period     AS period
+WITH a, i1, i2, i3,
+    CASE WHEN b.gstin < c.gstin THEN [b.gstin, c.gstin]
+         ELSE [c.gstin, b.gstin] END   AS pair
+WITH
+    a.gstin AS g_a,
+    pair[0] AS g_b,
+    pair[1] AS g_c,
+    collect(DISTINCT i1.invoice_id)
+      + collect(DISTINCT i2.invoice_id)
+      + collect(DISTINCT i3.invoice_id)  AS invoice_ids,
+    min(i1._period)                      AS period
+ORDER BY size(invoice_ids) DESC
 LIMIT 500
+RETURN g_a, g_b, g_c, invoice_ids, period
 """
 
 # ---------------------------------------------------------------------------
@@ -65,13 +75,15 @@ MATCH
     (i2:Invoice)-[:ISSUED_BY]->(b),
     (i2)-[:RECEIVED_BY]->(a)
 WHERE a <> b AND a.gstin < b.gstin
-RETURN
-    a.gstin        AS g_a,
-    b.gstin        AS g_b,
-    i1.invoice_id  AS inv_ab,
-    i2.invoice_id  AS inv_ba,
-    i1._period     AS period
+WITH
+    a.gstin AS g_a,
+    b.gstin AS g_b,
+    collect(DISTINCT i1.invoice_id)
+      + collect(DISTINCT i2.invoice_id)  AS invoice_ids,
+    min(i1._period)                      AS period
+ORDER BY size(invoice_ids) DESC
 LIMIT 500
+RETURN g_a, g_b, invoice_ids, period
 """
 
 
@@ -85,9 +97,9 @@ def detect_circular_trades() -> list[CircularTradeResult]:
     Query the graph for circular trading patterns.
     Returns a deduplicated list of CircularTradeResult.
     """
-    results: dict[str, CircularTradeResult] = {}
+    results: list[CircularTradeResult] = []
 
-    # ── 3-node loops ─────────────────────────────────────────────────────
+    # ── 3-node loops (already canonical + deduplicated in Cypher) ─────────
     try:
         rows3 = run_query(_CIRCULAR_3_QUERY)
     except Exception as exc:
@@ -96,22 +108,13 @@ def detect_circular_trades() -> list[CircularTradeResult]:
 
     for row in rows3:
         gstins = [row["g_a"], row["g_b"], row["g_c"]]
-        cid    = _cycle_id(gstins)
-        if cid not in results:
-            results[cid] = CircularTradeResult(
-                cycle_id=cid,
-                gstins=gstins,
-                invoice_ids=[row["inv_ab"], row["inv_bc"], row["inv_ca"]],
-                period=row.get("period"),
-                risk_level=RiskLevel.HIGH,
-            )
-        else:
-            # Add any new invoice IDs to the existing cycle record
-            existing_ids = set(results[cid].invoice_ids)
-            for iid in [row["inv_ab"], row["inv_bc"], row["inv_ca"]]:
-                if iid and iid not in existing_ids:
-                    results[cid].invoice_ids.append(iid)
-                    existing_ids.add(iid)
+        results.append(CircularTradeResult(
+            cycle_id=_cycle_id(gstins),
+            gstins=gstins,
+            invoice_ids=[iid for iid in row["invoice_ids"] if iid],
+            period=row.get("period"),
+            risk_level=RiskLevel.HIGH,
+        ))
 
     # ── 2-node back-and-forth loops ───────────────────────────────────────
     try:
@@ -122,15 +125,13 @@ def detect_circular_trades() -> list[CircularTradeResult]:
 
     for row in rows2:
         gstins = [row["g_a"], row["g_b"]]
-        cid    = _cycle_id(gstins)
-        if cid not in results:
-            results[cid] = CircularTradeResult(
-                cycle_id=cid,
-                gstins=gstins,
-                invoice_ids=[row["inv_ab"], row["inv_ba"]],
-                period=row.get("period"),
-                risk_level=RiskLevel.HIGH,
-            )
+        results.append(CircularTradeResult(
+            cycle_id=_cycle_id(gstins),
+            gstins=gstins,
+            invoice_ids=[iid for iid in row["invoice_ids"] if iid],
+            period=row.get("period"),
+            risk_level=RiskLevel.HIGH,
+        ))
 
     logger.info("Circular trade detection: %d unique cycles found", len(results))
-    return list(results.values())
+    return results
@@ -25,6 +25,8 @@ from models.schemas import PaymentDelayResult, RiskLevel
 
 logger = logging.getLogger(__name__)
 
+# Thresholds are parameterized so the filter runs server-side: only vendors
+# that exceed the grace period (and the minimum invoice count) cross the wire.
 _DELAY_QUERY = """
 MATCH (i:Invoice)-[:ISSUED_BY]->(t:Taxpayer)
 MATCH (i)-[:PAID_VIA]->(p:TaxPayment)
@@ -36,11 +38,14 @@ WITH
         date(p.payment_date)
     ).days AS delay_days
 WHERE delay_days > 0
-RETURN
+WITH
     gstin,
     avg(delay_days)   AS avg_delay,
     max(delay_days)   AS max_delay,
     count(*)          AS invoice_count
+WHERE (avg_delay > $grace OR max_delay > $grace)
+  AND invoice_count >= $min_inv
+RETURN gstin, avg_delay, max_delay, invoice_count
 ORDER BY avg_delay DESC
 """
 
@@ -54,14 +59,15 @@ def detect_payment_delays(min_invoices: int = 1) -> list[PaymentDelayResult]:
     min_invoices : int
         Minimum number of delayed invoices required to flag a vendor.
     """
+    grace   = config.PAYMENT_GRACE_DAYS
+    chronic = config.CHRONIC_DELAY_DAYS
+
     try:
-        rows = run_query(_DELAY_QUERY)
+        rows = run_query(_DELAY_QUERY, {"grace": grace, "min_inv": min_invoices})
     except Exception as exc:
         logger.error("Payment delay query failed: %s", exc)
         return []
 
-    grace    = config.PAYMENT_GRACE_DAYS
-    chronic  = config.CHRONIC_DELAY_DAYS
     results: list[PaymentDelayResult] = []
 
     for row in rows:
@@ -69,11 +75,6 @@ def detect_payment_delays(min_invoices: int = 1) -> list[PaymentDelayResult]:
         max_delay  = float(row.get("max_delay") or 0)
         count      = int(row.get("invoice_count") or 0)
 
-        if avg_delay <= grace and max_delay <= grace:
-            continue
-        if count < min_invoices:
-            continue
-
         if avg_delay > chronic or max_delay > chronic:
             risk = RiskLevel.HIGH
         else:
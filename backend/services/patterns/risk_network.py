@@ -46,6 +46,7 @@ WITH
     count(DISTINCT CASE WHEN partner.risk_level = 'High'
                         THEN partner END)                       AS risky_partners
 WHERE total_partners > 0
+  AND toFloat(risky_partners) / toFloat(total_partners) >= $threshold
 RETURN
     gstin,
     total_partners,
@@ -60,10 +61,11 @@ def detect_risk_networks() -> list[RiskNetworkResult]:
     Detect taxpayers embedded in predominantly high-risk trading networks.
     Returns [] if risk_level has not yet been populated on Taxpayer nodes.
     """
-    threshold = config.RISKY_PARTNER_THRESHOLD
+    threshold      = config.RISKY_PARTNER_THRESHOLD
+    high_threshold = threshold * 2
 
     try:
-        rows = run_query(_NETWORK_QUERY)
+        rows = run_query(_NETWORK_QUERY, {"threshold": threshold})
     except Exception as exc:
         logger.error("Risk network query failed: %s", exc)
         return []
@@ -71,19 +73,16 @@ def detect_risk_networks() -> list[RiskNetworkResult]:
     results: list[RiskNetworkResult] = []
 
     for row in rows:
-        ratio = float(row.get("risky_ratio") or 0.0)
-        if ratio < threshold:
-            continue
-
+        ratio   = float(row.get("risky_ratio") or 0.0)
         total   = int(row.get("total_partners") or 0)
         risky   = int(row.get("risky_partners") or 0)
-        risk    = RiskLevel.HIGH if ratio >= threshold * 2 else RiskLevel.MEDIUM
+        risk    = RiskLevel.HIGH if ratio >= high_threshold else RiskLevel.MEDIUM
 
         results.append(RiskNetworkResult(
             gstin=row["gstin"],
             total_partners=total,
             risky_partners=risky,
-            risky_partner_ratio=round(ratio, 4),
+            risky_partner_ratio=ratio,
             risk_level=risk,
         ))
 
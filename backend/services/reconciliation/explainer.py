@@ -40,83 +40,90 @@ _HIGH_RISK_VALUE_PCT = 10.0
 _HIGH_RISK_FILING_DAYS = 30
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class ExplainResult:
     status:      InvoiceStatus
     risk_level:  RiskLevel
     explanation: str
 
 
-def explain(
+# An issue is a str.format template plus its args; formatting is deferred
+# until render() so classification stays format-free on the hot path.
+Issue = tuple[str, tuple]
+
+
+def classify(
     path_res:  PathCheckResult,
     value_res: ValueCheckResult,
     time_res:  TimeCheckResult,
-) -> ExplainResult:
+) -> tuple[InvoiceStatus, RiskLevel, list[Issue]]:
     """
-    Combine results from all three checkers into a single verdict.
+    Combine results from all three checkers into a verdict.
 
     Returns
     -------
-    ExplainResult with status, risk_level, and a plain-English explanation.
+    (status, risk_level, issues) where issues are unformatted
+    (template, args) tuples — pass them to render() for display text.
     """
-    parts: list[str] = []     # bullet points collected as evidence
-    high_risk_flags: list[str] = []
-    warning_flags:   list[str] = []
+    parts: list[Issue] = []     # bullet points collected as evidence
+    high_risk_flags: list[Issue] = []
+    warning_flags:   list[Issue] = []
 
     # ── 1. Path checks ────────────────────────────────────────────────────
     if not path_res.has_supplier:
-        high_risk_flags.append("Supplier Taxpayer node is not linked (ISSUED_BY missing).")
+        high_risk_flags.append(("Supplier Taxpayer node is not linked (ISSUED_BY missing).", ()))
     if not path_res.has_buyer:
-        warning_flags.append("Buyer Taxpayer node is not linked (RECEIVED_BY missing).")
+        warning_flags.append(("Buyer Taxpayer node is not linked (RECEIVED_BY missing).", ()))
     if not path_res.has_gstr1:
-        high_risk_flags.append("Invoice not reported in any GSTR-1 filing (REPORTED_IN missing).")
+        high_risk_flags.append(("Invoice not reported in any GSTR-1 filing (REPORTED_IN missing).", ()))
     if not path_res.has_gstr2b:
-        warning_flags.append("Invoice not reflected in buyer GSTR-2B (ITC auto-draft absent).")
+        warning_flags.append(("Invoice not reflected in buyer GSTR-2B (ITC auto-draft absent).", ()))
     if not path_res.has_payment:
-        warning_flags.append("No TaxPayment record linked to this invoice (PAID_VIA missing).")
+        warning_flags.append(("No TaxPayment record linked to this invoice (PAID_VIA missing).", ()))
 
     # ── 2. Value checks ───────────────────────────────────────────────────
     if value_res.is_missing_gstr1 and value_res.is_missing_pr:
-        high_risk_flags.append("No taxable value from any source (GSTR-1 or PR).")
+        high_risk_flags.append(("No taxable value from any source (GSTR-1 or PR).", ()))
     elif value_res.within_tolerance is False:
         dev = value_res.deviation_pct or 0.0
         if dev > _HIGH_RISK_VALUE_PCT:
-            high_risk_flags.append(
-                f"Large value mismatch: {dev:.2f}% deviation "
-                f"(GSTR-1={value_res.gstr1_val}, PR={value_res.pr_val})."
-            )
+            high_risk_flags.append((
+                "Large value mismatch: {:.2f}% deviation (GSTR-1={}, PR={}).",
+                (dev, value_res.gstr1_val, value_res.pr_val),
+            ))
         else:
-            warning_flags.append(
-                f"Minor value mismatch: {dev:.2f}% deviation "
-                f"(GSTR-1={value_res.gstr1_val}, PR={value_res.pr_val})."
-            )
+            warning_flags.append((
+                "Minor value mismatch: {:.2f}% deviation (GSTR-1={}, PR={}).",
+                (dev, value_res.gstr1_val, value_res.pr_val),
+            ))
     elif value_res.within_tolerance is True:
-        parts.append(f"Values match (deviation {value_res.deviation_pct:.2f}%).")
+        parts.append(("Values match (deviation {:.2f}%).", (value_res.deviation_pct,)))
 
     if value_res.tax_math_ok is False:
-        warning_flags.append("Tax component amounts (CGST+SGST+IGST) do not reconcile with total value.")
+        warning_flags.append(("Tax component amounts (CGST+SGST+IGST) do not reconcile with total value.", ()))
 
     # ── 3. Time / timeliness checks ───────────────────────────────────────
     if time_res.g1_filed_on_time is False and time_res.g1_days_late is not None:
         days = time_res.g1_days_late
+        late_issue: Issue = (
+            "GSTR-1 filed {} days late (due {}).",
+            (days, time_res.g1_due_date),
+        )
         if days > _HIGH_RISK_FILING_DAYS:
-            high_risk_flags.append(
-                f"GSTR-1 filed {days} days late (due {time_res.g1_due_date})."
-            )
+            high_risk_flags.append(late_issue)
         else:
-            warning_flags.append(
-                f"GSTR-1 filed {days} days late (due {time_res.g1_due_date})."
-            )
+            warning_flags.append(late_issue)
 
     if time_res.is_chronic_delay:
-        high_risk_flags.append(
-            f"Chronic payment delay: {time_res.days_to_payment} days "
-            f"from invoice date to payment."
-        )
+        high_risk_flags.append((
+            "Chronic payment delay: {} days from invoice date to payment.",
+            (time_res.days_to_payment,),
+        ))
     elif time_res.is_payment_delayed:
-        warning_flags.append(
-            f"Payment delayed: {time_res.days_to_payment} days from invoice date."
-        )
+        warning_flags.append((
+            "Payment delayed: {} days from invoice date.",
+            (time_res.days_to_payment,),
+        ))
 
     # ── Determine status ──────────────────────────────────────────────────
     no_source_data = value_res.is_missing_gstr1 and value_res.is_missing_pr
@@ -138,15 +145,34 @@ def explain(
     else:
         risk_level = RiskLevel.LOW
 
-    # ── Compose explanation ───────────────────────────────────────────────
-    all_issues = high_risk_flags + warning_flags + parts
-    if not all_issues:
-        all_issues = ["All reconciliation checks passed."]
+    return status, risk_level, high_risk_flags + warning_flags + parts
+
+
+def render(issues: list[Issue]) -> str:
+    """Format deferred issue tuples into the display explanation string."""
+    if not issues:
+        return "All reconciliation checks passed."
+    return " | ".join(
+        template.format(*args) if args else template
+        for template, args in issues
+    )
+
 
-    explanation = " | ".join(all_issues)
+def explain(
+    path_res:  PathCheckResult,
+    value_res: ValueCheckResult,
+    time_res:  TimeCheckResult,
+) -> ExplainResult:
+    """
+    Combine results from all three checkers into a single verdict.
 
+    Returns
+    -------
+    ExplainResult with status, risk_level, and a plain-English explanation.
+    """
+    status, risk_level, issues = classify(path_res, value_res, time_res)
     return ExplainResult(
         status=status,
         risk_level=risk_level,
-        explanation=explanation,
+        explanation=render(issues),
     )
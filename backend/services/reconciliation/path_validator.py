@@ -14,21 +14,65 @@ Expected relationships per invoice:
 
 from __future__ import annotations
 
-from dataclasses import dataclass, field
+from dataclasses import dataclass
 
+# Presence bits, LSB first, with the display name used when a hop is missing
+_REL_BITS: tuple[tuple[int, str], ...] = (
+    (0, "ISSUED_BY"),
+    (1, "RECEIVED_BY"),
+    (2, "REPORTED_IN (GSTR-1)"),
+    (3, "REFLECTED_IN (GSTR-2B)"),
+    (4, "PAID_VIA (TaxPayment)"),
+)
+_FULL_MASK = 0b11111
 
-@dataclass
+
+# slots + frozen: one instance per invoice on the batch path, so skip the
+# per-instance __dict__ and setattr dispatch. All five presence flags are
+# packed into a single bitmask; names are decoded lazily on access.
+@dataclass(slots=True, frozen=True)
 class PathCheckResult:
-    has_supplier:           bool
-    has_buyer:              bool
-    has_gstr1:              bool
-    has_gstr2b:             bool
-    has_payment:            bool
-    missing_relationships:  list[str] = field(default_factory=list)
+    # Presence bitmask: supplier, buyer, gstr1, gstr2b, payment (LSB first)
+    mask:           int
     # True only when ALL five relationships are present
-    is_complete:            bool = False
+    is_complete:    bool = False
     # Number of present hops (max 5)
-    coverage_score:         int = 0
+    coverage_score: int = 0
+
+    @classmethod
+    def from_mask(cls, mask: int) -> "PathCheckResult":
+        return cls(
+            mask=mask,
+            is_complete=(mask == _FULL_MASK),
+            coverage_score=mask.bit_count(),
+        )
+
+    @property
+    def has_supplier(self) -> bool:
+        return bool(self.mask & 0b00001)
+
+    @property
+    def has_buyer(self) -> bool:
+        return bool(self.mask & 0b00010)
+
+    @property
+    def has_gstr1(self) -> bool:
+        return bool(self.mask & 0b00100)
+
+    @property
+    def has_gstr2b(self) -> bool:
+        return bool(self.mask & 0b01000)
+
+    @property
+    def has_payment(self) -> bool:
+        return bool(self.mask & 0b10000)
+
+    @property
+    def missing_relationships(self) -> tuple[str, ...]:
+        """Decoded lazily — batch callers that only check is_complete skip it."""
+        return tuple(
+            name for bit, name in _REL_BITS if not (self.mask >> bit) & 1
+        )
 
 
 def check_paths(ctx: dict) -> PathCheckResult:
@@ -44,33 +88,11 @@ def check_paths(ctx: dict) -> PathCheckResult:
     -------
     PathCheckResult
     """
-    has_supplier: bool = bool(ctx.get("has_supplier"))
-    has_buyer:    bool = bool(ctx.get("has_buyer"))
-    has_gstr1:    bool = bool(ctx.get("has_gstr1"))
-    has_gstr2b:   bool = bool(ctx.get("has_gstr2b"))
-    has_payment:  bool = bool(ctx.get("has_payment"))
-
-    missing: list[str] = []
-    if not has_supplier:
-        missing.append("ISSUED_BY")
-    if not has_buyer:
-        missing.append("RECEIVED_BY")
-    if not has_gstr1:
-        missing.append("REPORTED_IN (GSTR-1)")
-    if not has_gstr2b:
-        missing.append("REFLECTED_IN (GSTR-2B)")
-    if not has_payment:
-        missing.append("PAID_VIA (TaxPayment)")
-
-    present = 5 - len(missing)
-
-    return PathCheckResult(
-        has_supplier=has_supplier,
-        has_buyer=has_buyer,
-        has_gstr1=has_gstr1,
-        has_gstr2b=has_gstr2b,
-        has_payment=has_payment,
-        missing_relationships=missing,
-        is_complete=(len(missing) == 0),
-        coverage_score=present,
+    mask = (
+        (bool(ctx.get("has_supplier")) << 0)
+        | (bool(ctx.get("has_buyer"))   << 1)
+        | (bool(ctx.get("has_gstr1"))   << 2)
+        | (bool(ctx.get("has_gstr2b"))  << 3)
+        | (bool(ctx.get("has_payment")) << 4)
     )
+    return PathCheckResult.from_mask(mask)
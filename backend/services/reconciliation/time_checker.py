@@ -15,6 +15,7 @@ invoice_date / filing_date / payment_date:  "YYYY-MM-DD" string or None
 
 from __future__ import annotations
 
+import functools
 import logging
 from dataclasses import dataclass
 from datetime import date, timedelta
@@ -25,7 +26,7 @@ logger = logging.getLogger(__name__)
 _GSTR1_DUE_DAY = 11
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class TimeCheckResult:
     # GSTR-1 filing timeliness
     g1_tax_period:        str  | None
@@ -42,10 +43,21 @@ class TimeCheckResult:
     is_chronic_delay:     bool          # > chronic_delay_days
 
 
+# Dates repeat heavily within a batch (a handful of filing/payment dates per
+# tax period), so both parse helpers are memoized; failures cache None.
+@functools.lru_cache(maxsize=4096)
 def _parse_date(s: object) -> date | None:
     """Parse "YYYY-MM-DD" string (or None) to a date object."""
     if not s:
         return None
+    # Fast path: values from the driver are already "YYYY-MM-DD..." strings,
+    # so slice the digit fields directly instead of str() + fromisoformat.
+    if isinstance(s, str) and len(s) >= 10:
+        try:
+            return date(int(s[0:4]), int(s[5:7]), int(s[8:10]))
+        except ValueError:
+            logger.debug("Could not parse date: %r", s)
+            return None
     try:
         return date.fromisoformat(str(s)[:10])
     except ValueError:
@@ -53,6 +65,7 @@ def _parse_date(s: object) -> date | None:
         return None
 
 
+@functools.lru_cache(maxsize=128)
 def _gstr1_due_date(tax_period: str) -> date | None:
     """
     Compute the GSTR-1 due date from a tax_period string like "042024".
@@ -78,6 +91,7 @@ def check_timing(
     ctx: dict,
     grace_days: int,
     chronic_delay_days: int,
+    today: date | None = None,
 ) -> TimeCheckResult:
     """
     Parameters
@@ -90,6 +104,9 @@ def check_timing(
         Payment is *delayed* if days_to_payment > grace_days.
     chronic_delay_days : int
         Payment is *chronically delayed* if days_to_payment > chronic_delay_days.
+    today : date, optional
+        Reference date for unpaid invoices; batch callers pass one value
+        for the whole run instead of a clock read per invoice.
 
     Returns
     -------
@@ -126,8 +143,9 @@ def check_timing(
     elif not has_payment:
         # No payment record at all — treat as maximum delay
         if invoice_date:
-            from datetime import date as _date
-            days_to_pay = (_date.today() - invoice_date).days
+            if today is None:
+                today = date.today()
+            days_to_pay = (today - invoice_date).days
             is_delayed  = days_to_pay > grace_days
             is_chronic  = days_to_pay > chronic_delay_days
 
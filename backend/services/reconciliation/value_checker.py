@@ -15,8 +15,10 @@ from __future__ import annotations
 
 from dataclasses import dataclass
 
+import numpy as np
 
-@dataclass
+
+@dataclass(slots=True, frozen=True)
 class ValueCheckResult:
     gstr1_val:          float | None
     pr_val:             float | None
@@ -107,10 +109,98 @@ def check_values(ctx: dict, tolerance_pct: float) -> ValueCheckResult:
         gstr1_val=gstr1_val,
         pr_val=pr_val,
         difference=difference,
-        deviation_pct=round(deviation_pct, 4) if deviation_pct is not None else None,
+        # Raw float — display paths format with :.2f, so per-row rounding
+        # here is wasted work.
+        deviation_pct=deviation_pct,
         within_tolerance=within_tol,
         is_missing_gstr1=missing_gstr1,
         is_missing_pr=missing_pr,
         tax_math_ok=tax_math_ok,
         message=msg,
     )
+
+
+def check_values_batch(
+    ctxs: list[dict],
+    tolerance_pct: float,
+) -> list[ValueCheckResult]:
+    """
+    Vectorized equivalent of check_values for a whole batch of contexts.
+
+    Stacks each value field into a float64 column (NaN = missing), computes
+    differences, deviations and the tax sanity check with NumPy broadcasting,
+    then materializes one ValueCheckResult per context in the input order.
+    """
+    if not ctxs:
+        return []
+
+    def _col(key: str) -> np.ndarray:
+        return np.array(
+            [v if (v := _to_float(c.get(key))) is not None else np.nan
+             for c in ctxs],
+            dtype=np.float64,
+        )
+
+    g1      = _col("gstr1_val")
+    pr      = _col("pr_val")
+    taxable = _col("taxable_value")
+    cgst    = _col("cgst")
+    sgst    = _col("sgst")
+    igst    = _col("igst")
+    total   = _col("total_value")
+
+    miss_g1 = np.isnan(g1)
+    miss_pr = np.isnan(pr)
+    both    = miss_g1 | miss_pr
+
+    with np.errstate(invalid="ignore", divide="ignore"):
+        diff   = g1 - pr
+        base   = np.where(g1 != 0, g1, pr)
+        dev    = np.where(base != 0, np.abs(diff) / np.abs(base) * 100, 0.0)
+        within = dev <= tolerance_pct
+
+        total_with_tax = taxable + cgst + sgst + igst
+        tax_ok   = np.abs(total_with_tax - total) <= 1.0
+        # Same skip conditions as the scalar path: any component missing,
+        # taxable falsy, or no total to compare against
+        tax_skip = (np.isnan(cgst) | np.isnan(sgst) | np.isnan(igst)
+                    | np.isnan(taxable) | (taxable == 0) | np.isnan(total))
+
+    results: list[ValueCheckResult] = []
+    for i in range(len(ctxs)):
+        m_g1 = bool(miss_g1[i])
+        m_pr = bool(miss_pr[i])
+        if both[i]:
+            difference    = None
+            deviation_pct = None
+            within_tol    = None
+            if m_g1 and m_pr:
+                msg = "Both GSTR-1 and PR taxable values are absent."
+            elif m_g1:
+                msg = "GSTR-1 taxable value is missing; cannot cross-check with PR."
+            else:
+                msg = "Purchase Register (PR) taxable value is missing; cannot cross-check with GSTR-1."
+        else:
+            difference    = float(diff[i])
+            deviation_pct = float(dev[i])
+            within_tol    = bool(within[i])
+            if within_tol:
+                msg = f"Values match within {tolerance_pct}% tolerance (deviation: {deviation_pct:.2f}%)."
+            else:
+                msg = (
+                    f"Value mismatch: GSTR-1={g1[i]:.2f}, PR={pr[i]:.2f} "
+                    f"({deviation_pct:.2f}% deviation, threshold={tolerance_pct}%)."
+                )
+
+        results.append(ValueCheckResult(
+            gstr1_val=None if m_g1 else float(g1[i]),
+            pr_val=None if m_pr else float(pr[i]),
+            difference=difference,
+            deviation_pct=deviation_pct,
+            within_tolerance=within_tol,
+            is_missing_gstr1=m_g1,
+            is_missing_pr=m_pr,
+            tax_math_ok=None if tax_skip[i] else bool(tax_ok[i]),
+            message=msg,
+        ))
+    return results